@@ -5,15 +5,43 @@ This script reads the deployments.json file, calculates the delay
 between planned and actual deployment dates, and updates the file.
 """
 
-import json
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+import gzip
+import os
 import sys
 
+import orjson
+
+# Buffer size for reading and writing the data file
+BUFFER_SIZE = 64 * 1024
+
+# Deployment type -> index into the per-type counters (2 = other)
+_TYPE_CODE = {'sprint': 0, 'hotfix': 1}
+
+@lru_cache(maxsize=4096)
+def _parse_date(value):
+    """Parse an ISO 8601 date, accepting a trailing 'Z' on Python < 3.11.
+
+    Results are memoized since many deployments share the same dates.
+    """
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+def _write_atomic(path, payload):
+    """Write payload to path in one call via a temp file and atomic rename."""
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'wb', buffering=BUFFER_SIZE) as f:
+        f.write(payload)
+    os.replace(tmp, path)
+
 def calculate_delays():
     """Calculate deployment delays for all deployments in the JSON file."""
     
     data_file = Path('data/deployments.json')
+    gzip_file = data_file.with_suffix('.json.gz')
     
     if not data_file.exists():
         print(f"❌ Error: {data_file} not found!")
@@ -21,52 +49,59 @@ def calculate_delays():
     
     try:
         # Read the data
-        with open(data_file, 'r') as f:
-            data = json.load(f)
+        with open(data_file, 'rb', buffering=BUFFER_SIZE) as f:
+            data = orjson.loads(f.read())
         
         print("=" * 60)
         print("Calculating Deployment Delays")
         print("=" * 60)
         
         total_delay = 0
-        sprint_count = 0
-        hotfix_count = 0
+        code_counts = [0, 0, 0]
         
-        # Calculate delays for each deployment
-        for deployment in data['deployments']:
-            try:
-                name = deployment.get('Name', 'Unknown')
-                
-                # Parse dates
-                planned = datetime.fromisoformat(
-                    deployment['PlannedDeploymentDate'].replace('Z', '+00:00')
-                )
-                actual = datetime.fromisoformat(
-                    deployment['DeploymentDate'].replace('Z', '+00:00')
-                )
-                
-                # Calculate delay in days
-                delay = (actual - planned).days
-                deployment['DelayDays'] = delay
-                
-                # Count by type
-                if deployment['Type'].lower() == 'sprint':
-                    sprint_count += 1
-                elif deployment['Type'].lower() == 'hotfix':
-                    hotfix_count += 1
-                
-                total_delay += delay
-                
-                # Print status
-                status = "✅" if delay <= 5 else "⚠️" if delay <= 10 else "❌"
-                print(f"{status} {name:20s}: {delay:3d} days delay")
-                
-            except KeyError as e:
-                print(f"⚠️  Warning: Missing field {e} in {name}")
-            except ValueError as e:
-                print(f"⚠️  Warning: Invalid date format in {name}: {e}")
+        parse_date = _parse_date
+        type_code = _TYPE_CODE.get
+        pretty = sys.stdout.isatty()  # Compact rows in CI logs
+        lines = []  # Per-deployment output, written in one call
+        
+        # Calculate delays for each deployment. Collected lines are written
+        # even if an unexpected error aborts the loop, so the log shows
+        # which deployment it stopped at.
+        try:
+            for deployment in data['deployments']:
+                try:
+                    name = deployment.get('Name', 'Unknown')
+                    
+                    # Parse dates
+                    planned = parse_date(deployment['PlannedDeploymentDate'])
+                    actual = parse_date(deployment['DeploymentDate'])
+                    
+                    # Calculate delay in days
+                    delay = (actual - planned).days
+                    deployment['DelayDays'] = delay
+                    
+                    # Count by type
+                    code_counts[type_code(deployment['Type'].lower(), 2)] += 1
+                    
+                    total_delay += delay
+                    
+                    # Record status
+                    if pretty:
+                        status = "✅" if delay <= 5 else "⚠️" if delay <= 10 else "❌"
+                        lines.append(f"{status} {name:20s}: {delay:3d} days delay")
+                    else:
+                        lines.append(f"{name}\t{delay}")
+                    
+                except KeyError as e:
+                    lines.append(f"⚠️  Warning: Missing field {e} in {name}")
+                except ValueError as e:
+                    lines.append(f"⚠️  Warning: Invalid date format in {name}: {e}")
+        finally:
+            if lines:
+                sys.stdout.write('\n'.join(lines) + '\n')
         
         # Calculate statistics
+        sprint_count, hotfix_count, _ = code_counts
         total_deployments = len(data['deployments'])
         avg_delay = total_delay / total_deployments if total_deployments > 0 else 0
         
@@ -74,8 +109,11 @@ def calculate_delays():
         data['lastUpdated'] = datetime.utcnow().isoformat() + 'Z'
         
         # Write back to file
-        with open(data_file, 'w') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        _write_atomic(data_file, payload)
+        
+        # Write a pre-compressed copy for serve_data
+        _write_atomic(gzip_file, gzip.compress(payload, compresslevel=6))
         
         # Print summary
         print("=" * 60)
@@ -91,7 +129,7 @@ def calculate_delays():
         print(f"   Last Updated: {data['lastUpdated']}")
         print("=" * 60)
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"❌ Error: Invalid JSON in {data_file}")
         print(f"   {e}")
         sys.exit(1)
@@ -6,11 +6,15 @@ using the REST API.
 """
 
 import os
-import json
 import requests
 import sys
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 
+# Buffer size for reading the dashboard file
+BUFFER_SIZE = 64 * 1024
+
 def deploy_dashboard():
     """Deploy dashboard to Grafana using API."""
     
@@ -50,23 +54,18 @@ def deploy_dashboard():
         sys.exit(1)
     
     try:
-        with open(dashboard_file, 'r') as f:
-            dashboard_config = json.load(f)
+        with open(dashboard_file, 'rb', buffering=BUFFER_SIZE) as f:
+            dashboard_json = f.read()
         print(f"✅ Dashboard JSON loaded: {dashboard_file}")
-    except json.JSONDecodeError as e:
-        print(f"❌ Error: Invalid JSON in dashboard file")
-        print(f"   {e}")
-        sys.exit(1)
     except Exception as e:
         print(f"❌ Error reading dashboard file: {e}")
         sys.exit(1)
     
-    # Update data source URL in dashboard if DATA_URL is provided
+    # Update data source URL in dashboard if DATA_URL is provided.
+    # The dashboard is sent as-is, so substitute in the raw bytes.
     if data_url:
         print(f"🔄 Updating data URL in dashboard...")
-        dashboard_json = json.dumps(dashboard_config)
-        dashboard_json = dashboard_json.replace('YOUR_DATA_URL_HERE', data_url)
-        dashboard_config = json.loads(dashboard_json)
+        dashboard_json = dashboard_json.replace(b'YOUR_DATA_URL_HERE', data_url.encode())
         print(f"✅ Data URL updated to: {data_url}")
     
     # Deploy to Grafana
@@ -74,12 +73,30 @@ def deploy_dashboard():
     print(f"📤 Deploying to: {api_endpoint}")
     print("   Please wait...")
     
+    # Reuse keep-alive connections for every request sent to Grafana, and
+    # retry transient gateway errors from a proxy in front of it. Read errors
+    # are not retried: the POST may already have been received, and a read
+    # timeout should surface as requests.exceptions.Timeout below.
+    retries = Retry(
+        total=3,
+        read=False,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=['POST'],
+        raise_on_status=False  # Hand the last response to the checks below
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(headers)
+    
     try:
-        response = requests.post(
+        # Send the file bytes directly; Content-Type is set on the session
+        response = session.post(
             api_endpoint,
-            json=dashboard_config,
-            headers=headers,
-            timeout=30,
+            data=dashboard_json,
+            timeout=(5, 30),  # (connect, read)
             verify=True  # Set to False if SSL certificate issues
         )
         
@@ -4,37 +4,79 @@ Simple HTTP server to serve deployment data
 This can be used to host the JSON data locally if needed.
 """
 
-from flask import Flask, jsonify, send_file
+from flask import Flask, Response, jsonify, request, send_file
 from flask_cors import CORS
-import json
+import orjson
+import threading
 from pathlib import Path
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
-DATA_FILE = Path('data/deployments.json')
+# Anchored to the repository so the server works from any working directory
+# (Flask resolves relative send_file paths against scripts/, not the cwd)
+DATA_FILE = Path(__file__).resolve().parent.parent / 'data' / 'deployments.json'
+GZIP_FILE = DATA_FILE.with_suffix('.json.gz')  # Written by calculate_delays.py
+BUFFER_SIZE = 64 * 1024
+
+# Fixed error bodies, encoded once. A fresh Response is still built per
+# request because after_request handlers (CORS) add headers to it.
+_ERR_DEPLOYMENTS_NOT_FOUND = orjson.dumps({"error": "Deployments file not found"})
+_ERR_INVALID_JSON = orjson.dumps({"error": "Invalid JSON in deployments file"})
+_ERR_FILE_NOT_FOUND = orjson.dumps({"error": "File not found"})
+
+# Encoded deployments payload, refreshed when the data file's mtime changes
+_cache = {'mtime': None, 'payload': b''}
+_cache_lock = threading.Lock()
+
+def _load_deployments():
+    """Return the encoded deployments, re-parsing the file only if it changed."""
+    mtime = DATA_FILE.stat().st_mtime_ns
+    with _cache_lock:
+        if mtime != _cache['mtime']:
+            with open(DATA_FILE, 'rb', buffering=BUFFER_SIZE) as f:
+                data = orjson.loads(f.read())
+            _cache['payload'] = orjson.dumps(data)
+            _cache['mtime'] = mtime
+        return _cache['payload']
+
+def _gzip_is_fresh():
+    """Return True if the pre-compressed copy is at least as new as the data file."""
+    try:
+        return GZIP_FILE.stat().st_mtime_ns >= DATA_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
 
 @app.route('/api/deployments')
 def get_deployments():
     """Serve deployment data as JSON API."""
     try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
-        return jsonify(data), 200
+        return Response(_load_deployments(), status=200, mimetype='application/json')
     except FileNotFoundError:
-        return jsonify({"error": "Deployments file not found"}), 404
-    except json.JSONDecodeError:
-        return jsonify({"error": "Invalid JSON in deployments file"}), 500
+        return Response(_ERR_DEPLOYMENTS_NOT_FOUND, status=404, mimetype='application/json')
+    except orjson.JSONDecodeError:
+        return Response(_ERR_INVALID_JSON, status=500, mimetype='application/json')
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/deployments.json')
 def get_deployments_file():
-    """Serve raw JSON file."""
+    """Serve raw JSON file, gzip-compressed if the client accepts it."""
     try:
-        return send_file(DATA_FILE, mimetype='application/json')
+        if request.accept_encodings['gzip'] and _gzip_is_fresh():
+            response = send_file(
+                GZIP_FILE,
+                mimetype='application/json',
+                conditional=True,
+                download_name=DATA_FILE.name
+            )
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = send_file(DATA_FILE, mimetype='application/json', conditional=True)
+        response.vary.add('Accept-Encoding')
+        return response
     except FileNotFoundError:
-        return jsonify({"error": "File not found"}), 404
+        return Response(_ERR_FILE_NOT_FOUND, status=404, mimetype='application/json')
 
 @app.route('/health')
 def health():
@@ -66,6 +108,7 @@ if __name__ == '__main__':
     print("  - http://localhost:8080/api/deployments")
     print("  - http://localhost:8080/deployments.json")
     print("  - http://localhost:8080/health")
+    print("Development server only; use gunicorn with wsgi:app in production")
     print("=" * 60)
     
     # Run on all interfaces, port 8080
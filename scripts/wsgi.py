@@ -0,0 +1,12 @@
+"""
+WSGI entry point for the deployment data server
+Run from the repository root (--pythonpath is relative to the cwd):
+
+    gunicorn --pythonpath scripts -w 4 -k gthread --threads 8 \
+        --keep-alive 30 -b 0.0.0.0:8080 wsgi:app
+
+serve_data locates data/deployments.json relative to the repository,
+so the working directory does not affect which file is served.
+"""
+
+from serve_data import app  # noqa: F401  (re-exported for gunicorn)